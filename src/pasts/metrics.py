@@ -8,14 +8,28 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and limitations under the License.
 
+import numpy as np
 import pandas as pd
-from darts import TimeSeries
 import warnings
 from sklearn.metrics import r2_score, mean_squared_error
-from darts.metrics import mape, smape, mae
 from pasts.statistical_tests import check_arguments
 
 
+def mape(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """Mean absolute percentage error, as defined in darts.metrics."""
+    return 100. * np.mean(np.abs((y_true - y_pred) / y_true))
+
+
+def smape(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """Symmetric mean absolute percentage error, as defined in darts.metrics."""
+    return 200. * np.mean(np.abs(y_true - y_pred) / (np.abs(y_true) + np.abs(y_pred)))
+
+
+def mae(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """Mean absolute error, as defined in darts.metrics."""
+    return np.mean(np.abs(y_true - y_pred))
+
+
 dict_metrics_sklearn = {'r2': r2_score,
                         'mse': mean_squared_error,
                         'rmse': mean_squared_error}
@@ -38,7 +52,7 @@ class Metrics:
         keys: names in ['r2', 'mse', 'rmse']
         values: functions
     dict_metrics_darts: dict
-        Metrics from darts requested in class instantiation.
+        Metrics defined as in darts requested in class instantiation, computed on arrays.
         keys: names in ['mape', 'smape', 'mae']
         values: functions
 
@@ -91,7 +105,7 @@ class Metrics:
         Dataframe of scores with unit or time as index and metrics as columns
         """
         df_test = self.signal.test_data.copy()
-        df_pred = self.signal.models[model]['predictions'].pd_dataframe()
+        df_pred = self.signal.to_dataframe(model)
 
         if axis == 0:
             df_pred = df_pred.transpose()
@@ -101,15 +115,18 @@ class Metrics:
         for col in df_pred.columns:
             df_temp = pd.DataFrame(df_pred[col])
             df_temp['test'] = df_test[col]
+            if df_temp.isnull().sum().sum() != 0:
+                warnings.warn('Test set or predictions contain NaN values: they are deleted to compute the metrics',
+                              UserWarning)
+            df_temp.dropna(inplace=True)
+            test = df_temp[df_temp.columns[0]].values
+            pred = df_temp[df_temp.columns[1]].values
+            mse = None
             for metric in self.dict_metrics_sklearn.keys():
-                if df_temp.isnull().sum().sum() != 0:
-                    warnings.warn('Test set or predictions contain NaN values: they are deleted to compute the metrics',
-                                  UserWarning)
-                df_temp.dropna(inplace=True)
-                test = df_temp[df_temp.columns[0]].values
-                pred = df_temp[df_temp.columns[1]].values
-                if metric == 'rmse':
-                    results.loc[col, metric] = self.dict_metrics_sklearn[metric](test, pred, squared=False)
+                if metric in ['mse', 'rmse']:
+                    if mse is None:
+                        mse = mean_squared_error(test, pred)
+                    results.loc[col, metric] = np.sqrt(mse) if metric == 'rmse' else mse
                 else:
                     results.loc[col, metric] = self.dict_metrics_sklearn[metric](test, pred)
 
@@ -117,7 +134,7 @@ class Metrics:
 
     def _scores_darts(self, model: str) -> pd.DataFrame:
         """
-        Computes sklearn scores given by dict_metrics_sklearn.
+        Computes scores given by dict_metrics_darts.
 
         Parameters
         ----------
@@ -128,21 +145,27 @@ class Metrics:
         -------
         Dataframe of scores with unit or time as index and metrics as columns
         """
-        ts_test = TimeSeries.from_dataframe(self.signal.test_data)
-        ts_pred = self.signal.models[model]['predictions']
-        results = pd.DataFrame(index=ts_pred.columns, columns=list(self.dict_metrics_darts.keys()))
-        for col in ts_pred.columns:
+        df_pred = self.signal.to_dataframe(model)
+        index = df_pred.index.intersection(self.signal.test_data.index)
+        df_test = self.signal.test_data.loc[index]
+        df_pred = df_pred.loc[index]
+        has_zeros = df_test.eq(0.0).any(axis=None) or df_pred.eq(0.0).any(axis=None)
+        results = pd.DataFrame(index=df_pred.columns, columns=list(self.dict_metrics_darts.keys()))
+        for col in df_pred.columns:
+            test = df_test[col].values
+            pred = df_pred[col].values
+            not_nan = ~(np.isnan(test) | np.isnan(pred))
+            if not not_nan.all():
+                warnings.warn('Test set or predictions contain NaN values: they are deleted to compute the metrics',
+                              UserWarning)
+                test = test[not_nan]
+                pred = pred[not_nan]
             for metric in self.dict_metrics_darts.keys():
-                df_test = ts_test.pd_dataframe()
-                df_pred = ts_pred.pd_dataframe()
-                zero_indices_test = df_test.index[df_test.eq(0.0).any(axis=1)]
-                zero_indices_pred = df_pred.index[df_pred.eq(0.0).any(axis=1)]
-                zero_indices = zero_indices_test.union(zero_indices_pred)
-                if (metric == 'mape') & (len(zero_indices) > 0):
+                if (metric == 'mape') & has_zeros:
                     warnings.warn('Test set or predictions contain 0 values: cannot compute mape',
                                   UserWarning)
                 else:
-                    results.loc[col, metric] = self.dict_metrics_darts[metric](ts_test[col], ts_pred[col])
+                    results.loc[col, metric] = self.dict_metrics_darts[metric](test, pred)
         return results
 
     def compute_scores(self, model: str, axis: int) -> pd.DataFrame:
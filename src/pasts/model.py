@@ -8,14 +8,140 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and limitations under the License.
 
+import functools
+import os
+import tempfile
 from abc import ABC, abstractmethod
 
+import joblib
 import numpy as np
+from joblib import Parallel, delayed
 from pandas import MultiIndex
 
 import pandas as pd
 from darts import TimeSeries
 from sklearn.metrics import mean_squared_error
+from sklearn.model_selection import ParameterGrid
+
+
+def _disk_cache(key):
+    """
+    Memoizes the decorated function in joblib files.
+
+    The decorated function takes two additional keyword arguments: cache_dir, the directory where results are stored
+    (default is None, no caching), and refresh, whether to recompute the result even if it has already been stored
+    (default is False).
+    Results are written to a temporary file which is then renamed, so that an interrupted write does not leave a
+    truncated file. A file that cannot be loaded is considered missing.
+
+    Parameters
+    ----------
+    key : function
+        Called with the arguments of the decorated function, returns the objects identifying a result.
+        They are hashed with joblib.hash.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, cache_dir: str = None, refresh: bool = False):
+            if cache_dir is None:
+                return func(*args)
+            file = os.path.join(cache_dir, f'{func.__name__.strip("_")}_{joblib.hash(key(*args))}_jlib')
+            if not refresh and os.path.exists(file):
+                try:
+                    return joblib.load(file)
+                except Exception:
+                    pass
+            result = func(*args)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            os.close(fd)
+            try:
+                joblib.dump(result, tmp_file)
+                os.replace(tmp_file, file)
+            except BaseException:
+                os.remove(tmp_file)
+                raise
+            return result
+        return wrapper
+    return decorator
+
+
+def _tseries_key(tseries: TimeSeries) -> tuple:
+    """
+    Returns the content of a TimeSeries to be hashed.
+    The TimeSeries object itself cannot be hashed: its pickled form changes when it is sliced.
+    """
+    return tseries.time_index.values, list(tseries.columns), tseries.values()
+
+
+@_disk_cache(key=lambda model, train_tseries, horizon: (model.__class__.__name__, getattr(model, 'model_params', {}),
+                                                        _tseries_key(train_tseries), horizon))
+def _cached_fit_predict(model: object, train_tseries: TimeSeries, horizon: int) -> tuple:
+    """
+    Fits model on train series and predicts the following horizon dates.
+
+    Returns
+    -------
+    Fitted model and predicted TimeSeries
+    """
+    model.fit(train_tseries)
+    return model, model.predict(horizon)
+
+
+@_disk_cache(key=lambda model, parameters, train_tseries, forecast_horizon: (model.__class__.__name__, parameters,
+                                                                             _tseries_key(train_tseries),
+                                                                             forecast_horizon))
+def _cached_gridsearch(model: object, parameters: dict, train_tseries: TimeSeries, forecast_horizon: int) -> tuple:
+    """
+    Performs a gridsearch on train series. Only the best parameters are cached, not the fitted models.
+
+    Returns
+    -------
+    Best parameters and corresponding score
+    """
+    _, best_parameters, best_score = model.gridsearch(parameters=parameters,
+                                                      series=train_tseries,
+                                                      start=0.5,
+                                                      forecast_horizon=forecast_horizon)
+    return best_parameters, best_score
+
+
+def _fit_score(model_class: type, parameters: dict, train_tseries: TimeSeries, train_index: np.ndarray,
+               test_index: np.ndarray) -> float:
+    """
+    Fits a model on a cross-validation fold and computes its mean squared error on the following dates.
+    Returns infinity if the model cannot be fitted on the fold, e.g. if it is too short.
+    """
+    model = model_class(**parameters)
+    try:
+        model.fit(train_tseries[int(train_index[0]):int(train_index[-1]) + 1])
+    except ValueError:
+        return np.inf
+    forecast = model.predict(len(test_index))
+    return mean_squared_error(train_tseries[int(test_index[0]):int(test_index[-1]) + 1].values(), forecast.values())
+
+
+@_disk_cache(key=lambda model, parameters, train_tseries, folds: (model.__class__.__name__, parameters,
+                                                                  _tseries_key(train_tseries), folds))
+def _cached_cv_gridsearch(model: object, parameters: dict, train_tseries: TimeSeries, folds: list) -> tuple:
+    """
+    Performs a gridsearch on cross-validation folds of train series, fitting folds in parallel.
+    Parameters are evaluated with the mean squared error averaged over folds on which all of them can be fitted.
+    If there is no such fold, performs the gridsearch of darts on train series instead.
+
+    Returns
+    -------
+    Best parameters and corresponding score
+    """
+    grid = list(ParameterGrid(parameters))
+    scores = Parallel(n_jobs=-1)(delayed(_fit_score)(model.__class__, params, train_tseries, train_index, test_index)
+                                 for params in grid for train_index, test_index in folds)
+    scores = np.reshape(scores, (len(grid), len(folds)))
+    valid_folds = np.isfinite(scores).all(axis=0)
+    if not valid_folds.any():
+        return _cached_gridsearch.__wrapped__(model, parameters, train_tseries, 5)
+    scores = scores[:, valid_folds].mean(axis=1)
+    return grid[int(np.argmin(scores))], float(np.min(scores))
 
 
 class ModelAbstract(ABC):
@@ -46,7 +172,7 @@ class ModelAbstract(ABC):
         self.signal = signal
 
     @abstractmethod
-    def apply(self, model, gridsearch, parameters):
+    def apply(self, model, gridsearch, parameters, refresh, cache):
         pass
 
     @abstractmethod
@@ -67,10 +193,14 @@ class Model(ModelAbstract):
         """
         super().__init__(signal)
 
-    def apply(self, model: object, gridsearch: bool = False, parameters: dict = None) -> dict:
+    def apply(self, model: object, gridsearch: bool = False, parameters: dict = None, refresh: bool = False,
+              cache: bool = True) -> dict:
         """
         Applies given model on test set.
         If gridsearch is True and parameters are given, performs a gridsearch and saves the best parameters.
+        The gridsearch uses the cross-validation folds of the signal if they exist.
+        Fitted models, predictions and gridsearch results are cached in Signal.path/cache: a model with the same
+        parameters applied on the same train set is not refitted, unless cache is False.
 
         Parameters
         ----------
@@ -82,6 +212,11 @@ class Model(ModelAbstract):
                 Parameters used to perform the gridsearch (default is None)
                 keys: names of parameters
                 values: lists of parameters to test
+        refresh : bool, optional
+                Whether to refit the model and perform the gridsearch even if they are found in cache
+                (default is False)
+        cache : bool, optional
+                Whether to read and write results in Signal.path/cache (default is True)
 
         Returns
         -------
@@ -94,21 +229,24 @@ class Model(ModelAbstract):
         --------
         darts.models to see available models.
         """
-        train_tseries = TimeSeries.from_dataframe(self.signal.rest_train_data)
+        train_tseries = self.signal.rest_train_tseries
+        cache_dir = os.path.join(self.signal.path, 'cache') if cache else None
         if gridsearch:
             if parameters is None:
                 raise Exception("Please enter the parameters")
             print('Performing the gridsearch for', model.__class__.__name__, '...')
-            best_model, best_parameters, _ = model.gridsearch(parameters=parameters,
-                                                              series=train_tseries,
-                                                              start=0.5,
-                                                              forecast_horizon=5)
-            model = best_model
+            if self.signal.cv_tseries is not None:
+                best_parameters, _ = _cached_cv_gridsearch(model, parameters, train_tseries, self.signal.cv_tseries,
+                                                           cache_dir=cache_dir, refresh=refresh)
+            else:
+                best_parameters, _ = _cached_gridsearch(model, parameters, train_tseries, 5,
+                                                        cache_dir=cache_dir, refresh=refresh)
+            model = model.__class__(**best_parameters)
         else:
             best_parameters = "default"
 
-        model.fit(train_tseries)
-        forecast = model.predict(len(self.signal.test_data))
+        model, forecast = _cached_fit_predict(model, train_tseries, len(self.signal.test_data),
+                                              cache_dir=cache_dir, refresh=refresh)
         if self.signal.operation_train is not None:
             if self.signal.operation_train.dict_op:
                 forecast = TimeSeries.from_dataframe(self.signal.operation_train.transform(forecast.pd_dataframe()))
@@ -133,8 +271,7 @@ class Model(ModelAbstract):
         if model_name not in self.signal.models.keys():
             raise AttributeError(f'{model_name} has not been fitted.')
         model = self.signal.models[model_name]['estimator']
-        train_temp = TimeSeries.from_dataframe(self.signal.rest_data)
-        model.fit(train_temp)
+        model.fit(self.signal.rest_tseries)
         return model
 
 
@@ -151,7 +288,7 @@ class AggregatedModel(ModelAbstract):
         """
         super().__init__(signal)
 
-    def apply(self, model: dict, gridsearch=None, parameters=None) -> dict:
+    def apply(self, model: dict, gridsearch=None, parameters=None, refresh=None, cache=None) -> dict:
         """
         Aggregates given models according to their performance on test set.
         Requires the models to have been applied on test set.
@@ -163,6 +300,8 @@ class AggregatedModel(ModelAbstract):
                values: model instances
         gridsearch : Unused, added for compatibility
         parameters : Unused, added for compatibility
+        refresh : Unused, added for compatibility
+        cache : Unused, added for compatibility
 
         Returns
         -------
@@ -171,33 +310,34 @@ class AggregatedModel(ModelAbstract):
         'models' : stores passed dict_models,
         'scores' : will be filled when scores are computed}
         """
-        dict_pred = {model: self.signal.models[model][
-            'predictions'].pd_dataframe().copy() for model in model.keys()}
+        model_names = list(model.keys())
+        dict_pred = {model: self.signal.to_dataframe(model) for model in model_names}
         df_test = self.signal.test_data.copy()
         weights = pd.DataFrame(index=MultiIndex.from_product([self.signal.test_data.index,
                                                              self.signal.test_data.columns], names=['Date', 'Unité']),
-                               columns=list(model.keys()))
+                               columns=model_names)
         weights.drop(self.signal.test_data.index[0], level=0, inplace=True)
+        dates = weights.index.get_level_values(0).unique()
+        units = weights.index.get_level_values(1).unique()
         for model_ in weights.columns:
             df_pred = dict_pred[model_]
-            for date in weights.index.get_level_values(0).unique():
+            for date in dates:
                 df_pred_temp = df_pred[df_pred.index < date]
                 df_test_temp = df_test[df_test.index < date]
-                for ref in weights.index.get_level_values(1).unique():
+                for ref in units:
                     weights.loc[(date, ref)][model_] = 1 / mean_squared_error(df_test_temp[ref], df_pred_temp[ref],
                                                                               squared=False)
 
         for i in weights.index:
             weights.loc[i] = weights.loc[i] / (weights.loc[i].sum())
-        weights = weights.groupby('Unité')[list(model.keys())].mean()
+        weights = weights.groupby('Unité')[model_names].mean()
 
-        df_ag = pd.DataFrame(index=self.signal.models[list(model.keys())[0]]['predictions'].time_index,
-                             columns=self.signal.models[list(model.keys())[0]]['predictions'].columns)
+        df_ag = pd.DataFrame(index=dict_pred[model_names[0]].index, columns=dict_pred[model_names[0]].columns)
 
         for ref in df_ag.columns:
             res = [0 for _ in df_ag.index]
-            for model_ in model.keys():
-                pred = self.signal.models[model_]['predictions'].pd_dataframe()[ref].values
+            for model_ in model_names:
+                pred = dict_pred[model_][ref].values
                 res += pred * weights.loc[ref, model_]
             df_ag[ref] = res
 
@@ -217,8 +357,10 @@ class AggregatedModel(ModelAbstract):
         Predicted TimeSeries
         """
         dict_models = self.signal.models['AggregatedModel']['models']
-        df_ag = pd.DataFrame(index=self.signal.models[list(dict_models.keys())[0]]['forecast'].time_index,
-                             columns=self.signal.models[list(dict_models.keys())[0]]['forecast'].columns)
+        weights = self.signal.models['AggregatedModel']['weights']
+        dict_forecast = {model_: self.signal.to_dataframe(model_, 'forecast') for model_ in dict_models.keys()}
+        first_forecast = dict_forecast[list(dict_models.keys())[0]]
+        df_ag = pd.DataFrame(index=first_forecast.index, columns=first_forecast.columns)
         # conf_itv = df_ag.copy()
         # std = self.signal.models['AggregatedModel']['std_test']
         for ref in df_ag.columns:
@@ -226,8 +368,8 @@ class AggregatedModel(ModelAbstract):
             # itv_inf = [0 for _ in df_ag.index]
             # itv_sup = [0 for _ in df_ag.index]
             for model_ in dict_models.keys():
-                pred = self.signal.models[model_]['forecast'].pd_dataframe()[ref].values
-                res += pred * self.signal.models['AggregatedModel']['weights'].loc[ref, model_]
+                pred = dict_forecast[model_][ref].values
+                res += pred * weights.loc[ref, model_]
                 # itv_inf = [itv_inf[i] + self.signal.models['AggregatedModel']['weights'].loc[ref, model_] * (
                 #             pred[i] + (-1.96) * std[model_] * np.sqrt(i)) for i in range(len(itv_inf))]
                 # itv_sup = [itv_sup[i] + self.signal.models['AggregatedModel']['weights'].loc[ref, model_] * (
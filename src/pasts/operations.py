@@ -11,7 +11,6 @@
 import numpy as np
 import pandas as pd
 from darts import TimeSeries
-from darts.models import XGBModel
 from darts.utils.statistics import check_seasonality
 from sklearn.linear_model import LinearRegression
 
@@ -265,6 +264,8 @@ class Seasonality:
                 diff.append(res)
             df_diff[col] = diff
         self.seasonal_component = df_diff
+        # xgboost is slow to import and is only needed to remove seasonality
+        from darts.models import XGBModel
         self.estimator_future_season = XGBModel(lags=self.seasonality)
         self.estimator_future_season.fit(TimeSeries.from_dataframe(self.seasonal_component))
 
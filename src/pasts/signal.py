@@ -11,6 +11,7 @@
 import copy
 import warnings
 from abc import ABC
+from functools import cached_property
 from typing import Union
 import joblib
 import os
@@ -92,14 +93,17 @@ class Signal(ABC):
         self.path = path
         self.__data = data
         self.__rest_data = data.copy()
+        self.__has_transformations = False
         self.__operation_train = None
         self.__operation_data = None
-        self.__properties = profiling(data)
         self.__tests_stat = {}
+        self.__tests_cache = {}
         self.__train_data = None
         self.__test_data = None
         self.__rest_train_data = None
         self.__cv_tseries = None
+        self.__tseries = {}
+        self.__frames = {}
         self.models = {}
         self.__performance_models = {}
 
@@ -113,6 +117,11 @@ class Signal(ABC):
         """Residual after applying operations to the data"""
         return self.__rest_data
 
+    @property
+    def has_transformations(self):
+        """Whether operations have transformed the data"""
+        return self.__has_transformations
+
     @property
     def operation_data(self):
         """Operation object called on data"""
@@ -133,15 +142,30 @@ class Signal(ABC):
         """Test set as a pandas dataframe"""
         return self.__test_data
 
+    @property
+    def cv_tseries(self):
+        """Cross-validation folds of train set as a list of (train indexes, test indexes), if requested"""
+        return self.__cv_tseries
+
     @property
     def rest_train_data(self):
         """Residual after applying operations to train set"""
         return self.__rest_train_data
 
     @property
+    def rest_tseries(self):
+        """Residual after applying operations to the data as a darts TimeSeries"""
+        return self._to_tseries('rest_data')
+
+    @property
+    def rest_train_tseries(self):
+        """Residual after applying operations to train set as a darts TimeSeries"""
+        return self._to_tseries('rest_train_data')
+
+    @cached_property
     def properties(self):
-        """Dictionary of properties of the signal"""
-        return self.__properties
+        """Dictionary of properties of the signal, computed on first access"""
+        return profiling(self.data)
 
     @property
     def tests_stat(self):
@@ -154,11 +178,44 @@ class Signal(ABC):
         contain a dataframe for each scorer, with scores computed for all models."""
         return self.__performance_models
 
+    def _to_tseries(self, name: str) -> TimeSeries:
+        """
+        Converts the dataframe attribute name to a darts TimeSeries.
+        The conversion is reused as long as the attribute is not replaced.
+        """
+        data = getattr(self, name)
+        if name not in self.__tseries or self.__tseries[name][0] is not data:
+            self.__tseries[name] = (data, TimeSeries.from_dataframe(data))
+        return self.__tseries[name][1]
+
+    def to_dataframe(self, model_name: str, key: str = 'predictions') -> pd.DataFrame:
+        """
+        Converts predictions or forecasts of a model to a pandas dataframe.
+
+        The conversion is reused as long as the predictions or forecasts are not recomputed.
+        The returned dataframe should not be modified.
+
+        Parameters
+        ----------
+        model_name : str
+                Name of a model.
+        key : str, optional
+                'predictions' or 'forecast' (default is 'predictions')
+
+        Returns
+        -------
+        Dataframe with time as index and units as columns
+        """
+        tseries = self.models[model_name][key]
+        if (model_name, key) not in self.__frames or self.__frames[(model_name, key)][0] is not tseries:
+            self.__frames[(model_name, key)] = (tseries, tseries.pd_dataframe())
+        return self.__frames[(model_name, key)][1]
+
     def apply_stat_test(self, type_test: str, test_stat_name: str = None, *args, **kwargs) -> None:
         """
         Applies statistical test to the univariate or multivariate series.
 
-        Fills the attribute tests_stat.
+        Fills the attribute tests_stat. A test already applied with the same arguments is not computed again.
 
         Parameters
         ----------
@@ -172,24 +229,21 @@ class Signal(ABC):
         -------
         None
         """
-        call_test = TestStatistics(self)
         if (type_test == 'stationary') & (test_stat_name is None):
             test_stat_name = 'adfuller'
-            self.tests_stat[f"{type_test}: {test_stat_name}"] = call_test.apply(type_test, test_stat_name,
-                                                                                *args, **kwargs)
-        elif (type_test == 'stationary') & (test_stat_name is not None):
-            self.tests_stat[f"{type_test}: {test_stat_name}"] = call_test.apply(type_test, test_stat_name,
-                                                                                *args, **kwargs)
-        else:
+        elif type_test != 'stationary':
             test_stat_name = dict_test[type_test]
-            self.tests_stat[f"{type_test}: {test_stat_name}"] = call_test.apply(type_test, test_stat_name,
-                                                                                *args, **kwargs)
+        key = joblib.hash((type_test, test_stat_name, args, kwargs))
+        if key not in self.__tests_cache:
+            self.__tests_cache[key] = TestStatistics(self).apply(type_test, test_stat_name, *args, **kwargs)
+        self.tests_stat[f"{type_test}: {test_stat_name}"] = self.__tests_cache[key]
 
     def validation_split(self, timestamp: Union[int, str, pd.Timestamp], n_splits_cv=None) -> None:
         """
         Splits the series between train and test sets.
 
-        If n_splits_cv is filled, yields train and test indices for cross-validation.
+        If n_splits_cv is filled, computes train and test indices for cross-validation.
+        They are then used to evaluate parameters when a gridsearch is performed.
 
         Fills the attributes train_data, test_data and rest_train_data (with train_data per default)
 
@@ -212,6 +266,7 @@ class Signal(ABC):
         self.__test_data = call_validation.test_data
         self.__cv_tseries = call_validation.cv_tseries
         self.__rest_train_data = self.train_data.copy()
+        self.__tseries = {}
 
     def apply_operations(self, list_op: list[str]) -> None:
         """
@@ -231,6 +286,7 @@ class Signal(ABC):
             raise Exception('No train data found. Perform split before applying operations.')
         self.__operation_data = Operation(self.data)
         self.__rest_data = self.operation_data.fit_transform(list_op)
+        self.__has_transformations = bool(self.operation_data.dict_op)
         if self.train_data is not None:
             self.__operation_train = Operation(self.train_data)
             self.__rest_train_data = self.operation_train.fit_transform(list_op)
@@ -239,7 +295,9 @@ class Signal(ABC):
                     model: object,
                     gridsearch: bool = False,
                     parameters: dict = None,
-                    save_model: bool = False) -> None:
+                    save_model: bool = False,
+                    refresh: bool = False,
+                    cache: bool = True) -> None:
         """
         Applies statistical, machine learning of deep learning model to the series.
 
@@ -258,12 +316,19 @@ class Signal(ABC):
                 When True, also saves data, train and test set, and transformed data (if it exists).
                 If the same model with different parameters has previously been saved from the same Signal object,
                 the file will be overwritten.
+        refresh : bool, optional
+                Whether to refit the model even if it has been cached in Signal.path/cache (default is False).
+                Fitted models, predictions and gridsearch results are cached for each model, parameters and train set.
+        cache : bool, optional
+                Whether to read and write results in Signal.path/cache (default is True).
+                When False, nothing is written on disk.
 
         Returns
         -------
         None
         """
-        self.models[model.__class__.__name__] = Model(self).apply(copy.deepcopy(model), gridsearch, parameters)
+        self.models[model.__class__.__name__] = Model(self).apply(copy.deepcopy(model), gridsearch, parameters,
+                                                                  refresh, cache)
         if save_model:
             joblib.dump(self.models[model.__class__.__name__], os.path.join(self.path,
                                                                             f'{model.__class__.__name__}_train_jlib'))
@@ -313,7 +378,7 @@ class Signal(ABC):
         list_models :
                 List of instances of models.
         refit : bool, optional
-                Whether to refit estimators even if they were previously fitted (default is False).
+                Whether to refit estimators even if they were previously fitted or cached (default is False).
                 Ignored for estimators not previously fitted.
         save_model : bool, optional
                 Whether to save the model in a file in Signal.path (default is False).
@@ -328,7 +393,7 @@ class Signal(ABC):
         dict_models = {model.__class__.__name__: model for model in list_models}
         if refit:
             for model in dict_models.values():
-                self.apply_model(model)
+                self.apply_model(model, refresh=True)
         else:
             for model_name, model in dict_models.items():
                 if model_name not in self.models.keys():
@@ -412,22 +477,17 @@ class Signal(ABC):
         if model_name not in self.models.keys():
             raise AttributeError(f'{model_name} has not been fitted.')
         pred = self.models[model_name]['predictions']
-        df_itv = pd.DataFrame(index=pred.time_index, columns=pred.columns)
-        df_residuals = df_itv.copy()
-        std = {}
-        for ref in pred.columns:
-            errors = self.test_data[ref].values - pred[ref].values()[:, 0]
-            df_residuals[ref] = errors
-
-            std[ref] = pd.Series(errors).rolling(window=window_size).std().values
+        values = pred.values()
+        errors = self.test_data[pred.columns].values - values
+        df_residuals = pd.DataFrame(errors, index=pred.time_index, columns=pred.columns)
 
-            weights = np.arange(1, len(pred) + 1, dtype=float)
+        std = df_residuals.rolling(window=window_size).std().values
+        weights = np.arange(1, len(pred) + 1, dtype=float)
+        margin = 1.96 * std * np.sqrt(weights)[:, np.newaxis]
 
-            itv_inf = pred[ref].values()[:, 0] - 1.96 * std[ref] * np.sqrt(weights)
-            itv_sup = pred[ref].values()[:, 0] + 1.96 * std[ref] * np.sqrt(weights)
-
-            df_itv[ref] = list(zip(itv_inf, itv_sup))
-        self.models[model_name]['test_confidence_interval'] = df_itv
+        dict_itv = {ref: pd.DataFrame({'lower': values[:, j] - margin[:, j], 'upper': values[:, j] + margin[:, j]},
+                                      index=pred.time_index) for j, ref in enumerate(pred.columns)}
+        self.models[model_name]['test_confidence_interval'] = dict_itv
         self.models[model_name]['test_residuals'] = df_residuals
 
     def _conf_interval_forecast(self, model_name: str):
@@ -437,19 +497,16 @@ class Signal(ABC):
             raise AttributeError(f'No forecasts have been computed with model {model_name}.')
 
         pred = self.models[model_name]['forecast']
-        df_itv = pd.DataFrame(index=pred.time_index, columns=pred.columns)
-
-        for ref in pred.columns:
-            std = np.std(self.models[model_name]['test_residuals'][ref])
-
-            weights = np.arange(1, len(pred) + 1, dtype=float)
+        values = pred.values()
+        std = self.models[model_name]['test_residuals'][pred.columns].astype(float).std(ddof=0).values
 
-            itv_inf = pred[ref].values()[:, 0] - 1.96 * std * np.sqrt(weights)
-            itv_sup = pred[ref].values()[:, 0] + 1.96 * std * np.sqrt(weights)
+        weights = np.arange(1, len(pred) + 1, dtype=float)
+        margin = 1.96 * np.sqrt(weights)[:, np.newaxis] * std
 
-            df_itv[ref] = list(zip(itv_inf, itv_sup))
+        dict_itv = {ref: pd.DataFrame({'lower': values[:, j] - margin[:, j], 'upper': values[:, j] + margin[:, j]},
+                                      index=pred.time_index) for j, ref in enumerate(pred.columns)}
 
-        self.models[model_name]['forecast_confidence_interval'] = df_itv
+        self.models[model_name]['forecast_confidence_interval'] = dict_itv
 
     def compute_conf_intervals(self, window_size: int = 10, save=False):
         if not self.models:
@@ -479,6 +536,7 @@ class Signal(ABC):
                     name = match_data.group(1)
                     if name == 'rest':
                         self.__rest_data = joblib.load(file)
+                        self.__has_transformations = not self.data.equals(self.__rest_data)
                     elif name == 'rest_train':
                         self.__rest_train_data = joblib.load(file)
                     elif name == 'test':
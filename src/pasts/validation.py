@@ -42,7 +42,7 @@ class Validation:
     @property
     def cv_tseries(self):
         """
-        Cross-validation indexes if requested (default None)
+        Cross-validation indexes if requested, as a list of (train indexes, test indexes) (default None)
         """
         return self.__cv_tseries
 
@@ -64,11 +64,10 @@ class Validation:
 
         if n_splits_cv is not None:
             time_series_cross_validation = TimeSeriesSplit(n_splits=n_splits_cv)
+            self.__cv_tseries = list(time_series_cross_validation.split(self.train_data))
 
-            for fold, (train_index, test_index) in enumerate(time_series_cross_validation.split(self.train_data)):
+            for fold, (train_index, test_index) in enumerate(self.__cv_tseries):
                 print("Fold: {}".format(fold))
                 print("TRAIN indices:", train_index[0], " -->", train_index[-1])
                 print("TEST  indices:", test_index[0], "-->", test_index[-1])
                 print("\n")
-
-            self.__cv_tseries = time_series_cross_validation.split(self.train_data)
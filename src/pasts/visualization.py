@@ -10,8 +10,10 @@
 
 import warnings
 
+import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
 from pandas.plotting import autocorrelation_plot
 import plotly.graph_objects as go
 import matplotlib
@@ -30,6 +32,8 @@ colors = [
     '#17becf'   # blue-teal
 ]
 
+hex_colors = tuple(matplotlib.colors.cnames.values())
+
 
 class Visualization:
     """
@@ -69,33 +73,48 @@ class Visualization:
         signal : Signal
         """
         self.__signal = signal
+        self.__figures = {}
+
+    @property
+    def figures(self):
+        """Dictionary of figures drawn without being displayed, with names of plotting methods as keys"""
+        return {name: fig for name, (fig, _) in self.__figures.items()}
+
+    def _subplots(self, name: str, display: bool) -> tuple:
+        """
+        Creates a figure and its axes.
+
+        Figures that are not displayed are not managed by pyplot: they are created once per plotting method and
+        cleared when the method is called again. Axes are recreated so that no plotting state is kept from a previous
+        call.
+        """
+        if display is True:
+            return plt.subplots()
+        fig = self.__figures[name][0] if name in self.__figures else Figure()
+        fig.clear()
+        ax = fig.subplots()
+        self.__figures[name] = (fig, ax)
+        return fig, ax
 
     def plot_signal(self, display=True, **kwargs) -> None:
         """
         Plots raw data and transformed data if operations have been applied.
         """
-        fig, ax = plt.subplots()
-        legend = []
-        i = 0
-        self.__signal.data.plot(ax=ax, **kwargs)
-        for col in self.__signal.data.columns:
-            legend.append(f'raw data: {col}')
-            i += 1
-        if (self.__signal.data - self.__signal.rest_data).sum().sum() != 0:
-            self.__signal.rest_data.plot(ax=ax, **kwargs)
-            for col in self.__signal.rest_data.columns:
-                legend.append(f'transformed data: {col}')
-                i += 1
-        plt.legend(legend)
-        if self.__signal.operation_train is not None:
-            if self.__signal.operation_train.dict_op:
-                plt.title(f'Operations to transform data: {list(self.__signal.operation_data.dict_op.keys())}',
-                          fontdict={'fontsize': 10})
+        signal = self.__signal
+        fig, ax = self._subplots('plot_signal', display)
+        signal.data.plot(ax=ax, **kwargs)
+        legend = [f'raw data: {col}' for col in signal.data.columns]
+        if signal.has_transformations:
+            signal.rest_data.plot(ax=ax, **kwargs)
+            legend += [f'transformed data: {col}' for col in signal.rest_data.columns]
+        ax.legend(legend)
+        if signal.operation_train is not None:
+            if signal.operation_train.dict_op:
+                ax.set_title(f'Operations to transform data: {list(signal.operation_data.dict_op.keys())}',
+                             fontdict={'fontsize': 10})
 
         if display is True:
             plt.show()
-        else:
-            plt.close()
 
     def acf_plot(self) -> None:
         """
@@ -109,44 +128,41 @@ class Visualization:
         """
         Plots raw data and predicted values on same graph.
         """
-        fig, ax = plt.subplots()
-        if not self.__signal.models:
+        signal = self.__signal
+        models = signal.models
+        data = signal.data
+        fig, ax = self._subplots('show_predictions', display)
+        if not models:
             raise Exception('No predictions have been computed.')
-        n_signals = self.__signal.test_data.shape[1]
+        n_signals = signal.test_data.shape[1]
+        suffixes = [f'_s{i}' for i in range(1, n_signals + 1)]
 
-        labels = ['Actuals_s' + str(i) for i in range(1, n_signals + 1)]
-        ax.plot(self.__signal.data, c='gray')
+        labels = [f'Actuals{s}' for s in suffixes]
+        ax.plot(data, c='gray')
         if aggregated_only:
-            if 'AggregatedModel' not in self.__signal.models.keys():
+            if 'AggregatedModel' not in models.keys():
                 raise Exception('No predictions have been computed with aggregated model')
             else:
                 to_plot = ['AggregatedModel']
-                for i, unit in enumerate(self.__signal.data.columns):
-                    itv = self.__signal.models['AggregatedModel']['test_confidence_interval']
-                    bounds = pd.DataFrame(index=self.__signal.models['AggregatedModel']['test_confidence_interval'].index)
-                    bounds['lower'] = [interval[0] for interval in itv[unit].values]
-                    bounds['upper'] = [interval[1] for interval in itv[unit].values]
-                    ax.plot(bounds, color='green', linestyle='--')
-                    ax.fill_between(bounds.index, bounds['lower'], bounds['upper'], color='green', alpha=0.3)
-                    labels += [f'lower_s{str(i + 1)}', f'upper_s{str(i + 1)}', f'interval_s{str(i + 1)}']
+                itv = models['AggregatedModel']['test_confidence_interval']
+                index = itv[data.columns[0]].index
+                bounds = np.stack([itv[unit].values for unit in data.columns])
+                for i in range(len(data.columns)):
+                    ax.plot(index, bounds[i], color='green', linestyle='--')
+                    ax.fill_between(index, bounds[i, :, 0], bounds[i, :, 1], color='green', alpha=0.3)
+                labels += [f'{label}{s}' for s in suffixes for label in ['lower', 'upper', 'interval']]
         else:
-            to_plot = self.__signal.models.keys()
+            to_plot = models.keys()
 
-        for model in to_plot:
-            pred = pd.DataFrame(self.__signal.models[model]['predictions'].values())
-            pred.columns = self.__signal.models[model]['predictions'].columns
-            pred.index = self.__signal.models[model]['predictions'].time_index
-            ax.plot(pred)
-            list_model_label = [model + '_s' + str(i) for i in range(1, n_signals + 1)]
-            labels += list_model_label
+        pred = pd.concat([signal.to_dataframe(model) for model in to_plot], axis=1)
+        ax.plot(pred.index, pred.values)
+        labels += [f'{model}{s}' for model in to_plot for s in suffixes]
 
         ax.legend(labels)
-        plt.xlabel('time')
-        plt.ylabel('values')
+        ax.set_xlabel('time')
+        ax.set_ylabel('values')
         if display is True:
             plt.show()
-        else:
-            plt.close()
 
     def show_predictions_plotly(self):
         """
@@ -166,17 +182,14 @@ class Visualization:
         j = 0
         for model_name, model_data in self.__signal.models.items():
 
-            pred = model_data['predictions']
-            time_index = pred.time_index
-            pred = pred.pd_dataframe()
+            pred = self.__signal.to_dataframe(model_name)
+            time_index = pred.index
 
             # Plot predictions
             for i, unit in enumerate(pred.columns):
                 if j < len(colors):
                     trace_color = colors[j]
                 else:
-                    colors_ = dict(matplotlib.colors.cnames.items())
-                    hex_colors = tuple(colors_.values())
                     trace_color = random.choice(hex_colors)
 
                 trace_pred = go.Scatter(x=time_index, y=pred[unit], mode='lines', name=f'{model_name}_s{i + 1}',
@@ -184,10 +197,7 @@ class Visualization:
                 fig.add_trace(trace_pred)
 
                 # Plot confidence interval
-                itv = model_data['test_confidence_interval'][unit]
-                bounds = pd.DataFrame(index=time_index)
-                bounds['lower'] = [interval[0] for interval in itv.values]
-                bounds['upper'] = [interval[1] for interval in itv.values]
+                bounds = model_data['test_confidence_interval'][unit]
 
                 fig.add_trace(go.Scatter(x=time_index, y=bounds['lower'], mode='lines',
                                          line=dict(color=trace_color, dash='dash'), showlegend=False,
@@ -213,48 +223,46 @@ class Visualization:
         """
         Plots raw data and forecasted values (for future dates) on same graph.
         """
-        fig, ax = plt.subplots()
-        n_signals = self.__signal.test_data.shape[1]
-
-        labels = ['Actuals_s' + str(i) for i in range(1, n_signals + 1)]
-        ax.plot(self.__signal.data, c='gray')
-        last_obs = self.__signal.data.iloc[-1:]
+        signal = self.__signal
+        models = signal.models
+        data = signal.data
+        fig, ax = self._subplots('show_forecast', display)
+        n_signals = signal.test_data.shape[1]
+        suffixes = [f'_s{i}' for i in range(1, n_signals + 1)]
+
+        labels = [f'Actuals{s}' for s in suffixes]
+        ax.plot(data, c='gray')
+        last_obs = data.iloc[-1:]
         if aggregated_only:
-            if 'AggregatedModel' not in self.__signal.models.keys():
+            if 'AggregatedModel' not in models.keys():
                 raise Exception('No predictions have been computed with aggregated model')
             else:
                 to_plot = ['AggregatedModel']
-                for i, unit in enumerate(self.__signal.data.columns):
-                    itv = self.__signal.models['AggregatedModel']['forecast_confidence_interval']
-                    bounds = pd.DataFrame(index=self.__signal.models['AggregatedModel'][
-                        'forecast_confidence_interval'].index)
-                    bounds['lower'] = [interval[0] for interval in itv[unit].values]
-                    bounds['upper'] = [interval[1] for interval in itv[unit].values]
-                    ax.plot(bounds, color='green', linestyle='--')
-                    ax.fill_between(bounds.index, bounds['lower'], bounds['upper'], color='green', alpha=0.3)
-                    labels += [f'lower_s{str(i + 1)}', f'upper_s{str(i + 1)}', f'interval_s{str(i + 1)}']
+                itv = models['AggregatedModel']['forecast_confidence_interval']
+                index = itv[data.columns[0]].index
+                bounds = np.stack([itv[unit].values for unit in data.columns])
+                for i in range(len(data.columns)):
+                    ax.plot(index, bounds[i], color='green', linestyle='--')
+                    ax.fill_between(index, bounds[i, :, 0], bounds[i, :, 1], color='green', alpha=0.3)
+                labels += [f'{label}{s}' for s in suffixes for label in ['lower', 'upper', 'interval']]
         else:
-            to_plot = self.__signal.models.keys()
+            to_plot = models.keys()
 
         for model in to_plot:
-            if 'forecast' not in self.__signal.models[model]:
+            if 'forecast' not in models[model]:
                 warnings.warn(f'No forecasts have been computed with {model}')
                 continue
-            pred = pd.DataFrame(self.__signal.models[model]['forecast'].values())
-            pred.columns = self.__signal.models[model]['forecast'].columns
-            pred.index = self.__signal.models[model]['forecast'].time_index
-            pred = pd.concat([last_obs, pred])
-            ax.plot(pred)
-            list_model_label = [model + '_s' + str(i) for i in range(1, n_signals + 1)]
+            pred = signal.to_dataframe(model, 'forecast')
+            ax.plot(np.concatenate([last_obs.index.values, pred.index.values]),
+                    np.vstack([last_obs[pred.columns].values, pred.values]))
+            list_model_label = [f'{model}{s}' for s in suffixes]
             labels += list_model_label
 
         ax.legend(labels)
-        plt.xlabel('time')
-        plt.ylabel('values')
+        ax.set_xlabel('time')
+        ax.set_ylabel('values')
         if display is True:
             plt.show()
-        else:
-            plt.close()
 
     def show_forecast_plotly(self):
         """
@@ -279,9 +287,7 @@ class Visualization:
                 warnings.warn(f'No forecasts have been computed with {model_name}')
                 continue
 
-            pred = pd.DataFrame(model_data['forecast'].values())
-            pred.columns = model_data['forecast'].columns
-            pred.index = model_data['forecast'].time_index
+            pred = self.__signal.to_dataframe(model_name, 'forecast')
             pred = pd.concat([last_obs, pred])
 
             # Plot predictions
@@ -289,8 +295,6 @@ class Visualization:
                 if j < len(colors):
                     trace_color = colors[j]
                 else:
-                    colors_ = dict(matplotlib.colors.cnames.items())
-                    hex_colors = tuple(colors_.values())
                     trace_color = random.choice(hex_colors)
 
                 trace_pred = go.Scatter(x=pred.index, y=pred[unit], mode='lines', name=f'{model_name}_s{i + 1}',
@@ -298,15 +302,12 @@ class Visualization:
                 fig.add_trace(trace_pred)
 
                 # Plot confidence interval
-                itv = model_data['forecast_confidence_interval'][unit]
-                bounds = pd.DataFrame(index=pred.index[1:])
-                bounds['lower'] = [interval[0] for interval in itv.values]
-                bounds['upper'] = [interval[1] for interval in itv.values]
+                bounds = model_data['forecast_confidence_interval'][unit]
 
-                fig.add_trace(go.Scatter(x=itv.index, y=bounds['lower'], mode='lines',
+                fig.add_trace(go.Scatter(x=bounds.index, y=bounds['lower'], mode='lines',
                                          line=dict(color=trace_color, dash='dash'), showlegend=False,
                                          legendgroup=f'CI_{model_name}_s{i+1}', name=f'CI_{model_name}_s{i+1}'))
-                fig.add_trace(go.Scatter(x=itv.index, y=bounds['upper'], mode='lines',
+                fig.add_trace(go.Scatter(x=bounds.index, y=bounds['upper'], mode='lines',
                                          line=dict(color=trace_color, dash='dash'), fill='tonexty',
                                          fillcolor=f'rgba{tuple(int(trace_color.lstrip("#")[i:i+2], 16) for i in (0, 2, 4)) + (0.3,)}',
                                          legendgroup=f'CI_{model_name}_s{i+1}', name=f'CI_{model_name}_s{i+1}'))
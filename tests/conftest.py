@@ -1,8 +1,20 @@
+import os
+import shutil
+
 import pandas as pd
 from darts.datasets import AirPassengersDataset, AustralianTourismDataset
 from pytest import fixture
 
 
+@fixture(autouse=True)
+def clear_model_cache():
+    # Signals created with path 'tests' must fit their models instead of loading them from a previous run
+    cache_dir = os.path.join('tests', 'cache')
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    yield
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+
 @fixture(scope="module")
 def get_univariate_data():
     series = AirPassengersDataset().load()
@@ -2,6 +2,8 @@ import pytest
 from darts.models import ExponentialSmoothing, AutoARIMA
 from darts.utils.utils import ModelMode, SeasonalityMode
 import math
+import os
+from unittest.mock import patch
 
 from pasts.signal import Signal
 
@@ -15,6 +17,10 @@ def test_validation_split(get_univariate_data):
     signal.validation_split(tstamp2, n_splits_cv=5)
     assert signal.test_data.shape[0] == 24
     assert signal.train_data.shape[0] == 120
+    assert signal.rest_train_tseries is signal.rest_train_tseries
+    assert len(signal.rest_train_tseries) == 120
+    signal.validation_split('1957-12-01')
+    assert len(signal.rest_train_tseries) == 108
 
 
 def test_apply_model(get_univariate_data):
@@ -32,6 +38,52 @@ def test_apply_model(get_univariate_data):
     assert isinstance(signal.models['AutoARIMA']['estimator'], AutoARIMA)
 
 
+def test_apply_model_cache(get_univariate_data, tmp_path):
+    signal = Signal(get_univariate_data, str(tmp_path))
+    tstamp = '1958-12-01'
+    signal.validation_split(tstamp)
+    with patch.object(ExponentialSmoothing, 'fit', autospec=True, side_effect=ExponentialSmoothing.fit) as fit:
+        signal.apply_model(ExponentialSmoothing())
+        assert fit.call_count == 1
+        pred = signal.models['ExponentialSmoothing']['predictions']
+        assert any(file.startswith('cached_fit_predict') for file in os.listdir(tmp_path / 'cache'))
+        signal.apply_model(ExponentialSmoothing())
+        assert fit.call_count == 1
+        assert signal.models['ExponentialSmoothing']['predictions'] == pred
+        signal.apply_model(ExponentialSmoothing(), refresh=True)
+        assert fit.call_count == 2
+        signal.validation_split('1957-12-01')
+        signal.apply_model(ExponentialSmoothing())
+        assert fit.call_count == 3
+    assert len(signal.models['ExponentialSmoothing']['predictions']) == 36
+
+
+def test_apply_model_no_cache(get_univariate_data, tmp_path):
+    signal = Signal(get_univariate_data, str(tmp_path))
+    signal.validation_split('1958-12-01')
+    with patch.object(ExponentialSmoothing, 'fit', autospec=True, side_effect=ExponentialSmoothing.fit) as fit:
+        signal.apply_model(ExponentialSmoothing(), cache=False)
+        signal.apply_model(ExponentialSmoothing(), cache=False)
+        assert fit.call_count == 2
+    assert not os.path.exists(tmp_path / 'cache')
+    assert len(signal.models['ExponentialSmoothing']['predictions']) == 24
+
+
+def test_apply_model_corrupted_cache(get_univariate_data, tmp_path):
+    signal = Signal(get_univariate_data, str(tmp_path))
+    signal.validation_split('1958-12-01')
+    signal.apply_model(ExponentialSmoothing())
+    files = os.listdir(tmp_path / 'cache')
+    assert len(files) == 1
+    with open(tmp_path / 'cache' / files[0], 'wb') as file:
+        file.write(b'truncated')
+    with patch.object(ExponentialSmoothing, 'fit', autospec=True, side_effect=ExponentialSmoothing.fit) as fit:
+        signal.apply_model(ExponentialSmoothing())
+        assert fit.call_count == 1
+    assert os.listdir(tmp_path / 'cache') == files
+    assert len(signal.models['ExponentialSmoothing']['predictions']) == 24
+
+
 def test_apply_model_grid(get_univariate_data):
     signal = Signal(get_univariate_data, 'tests')
     tstamp = '1958-12-01'
@@ -50,6 +102,53 @@ def test_apply_model_grid(get_univariate_data):
     assert isinstance(signal.models['ExponentialSmoothing']['estimator'], ExponentialSmoothing)
 
 
+def test_apply_model_grid_cache(get_univariate_data, tmp_path):
+    signal = Signal(get_univariate_data, str(tmp_path))
+    tstamp = '1958-12-01'
+    signal.validation_split(tstamp)
+    param_grid = {'trend': [ModelMode.ADDITIVE, ModelMode.NONE],
+                  'seasonal': [SeasonalityMode.ADDITIVE, SeasonalityMode.NONE],
+                  }
+    signal.apply_model(ExponentialSmoothing(), gridsearch=True, parameters=param_grid)
+    files = set(os.listdir(tmp_path / 'cache'))
+    assert any(file.startswith('cached_gridsearch') for file in files)
+    best_parameters = signal.models['ExponentialSmoothing']['best_parameters']
+    with patch.object(ExponentialSmoothing, 'fit', autospec=True, side_effect=ExponentialSmoothing.fit) as fit:
+        signal.apply_model(ExponentialSmoothing(), gridsearch=True, parameters=param_grid)
+        fit.assert_not_called()
+    assert set(os.listdir(tmp_path / 'cache')) == files
+    assert signal.models['ExponentialSmoothing']['best_parameters'] == best_parameters
+
+
+def test_apply_model_grid_cv(get_univariate_data, tmp_path):
+    signal = Signal(get_univariate_data, str(tmp_path))
+    tstamp = '1958-12-01'
+    signal.validation_split(tstamp, n_splits_cv=3)
+    assert len(signal.cv_tseries) == 3
+    param_grid = {'trend': [ModelMode.ADDITIVE, ModelMode.NONE],
+                  'seasonal': [SeasonalityMode.ADDITIVE, SeasonalityMode.NONE],
+                  }
+    signal.apply_model(ExponentialSmoothing(), gridsearch=True, parameters=param_grid)
+    files = set(os.listdir(tmp_path / 'cache'))
+    assert any(file.startswith('cached_cv_gridsearch') for file in files)
+    assert len(signal.models['ExponentialSmoothing']['best_parameters']) == 2
+    assert len(signal.models['ExponentialSmoothing']['predictions']) == 24
+    signal.apply_model(ExponentialSmoothing(), gridsearch=True, parameters=param_grid)
+    assert set(os.listdir(tmp_path / 'cache')) == files
+
+
+def test_apply_model_grid_cv_short_folds(get_univariate_data, tmp_path):
+    signal = Signal(get_univariate_data, str(tmp_path))
+    tstamp = '1958-12-01'
+    signal.validation_split(tstamp, n_splits_cv=5)
+    param_grid = {'trend': [ModelMode.ADDITIVE, ModelMode.NONE],
+                  'seasonal': [SeasonalityMode.ADDITIVE, SeasonalityMode.NONE],
+                  }
+    signal.apply_model(ExponentialSmoothing(), gridsearch=True, parameters=param_grid)
+    assert len(signal.models['ExponentialSmoothing']['best_parameters']) == 2
+    assert len(signal.models['ExponentialSmoothing']['predictions']) == 24
+
+
 def test_aggregated_model(get_univariate_data):
     signal = Signal(get_univariate_data, 'tests')
     tstamp = '1958-12-01'
@@ -88,6 +187,18 @@ def test_scores_unit(get_univariate_data):
         assert signal.performance_models['unit_wise'][metric].shape == (1, 3)
 
 
+def test_scores_nan(get_univariate_data, tmp_path):
+    data = get_univariate_data.copy()
+    data.iloc[-5] = float('nan')
+    signal = Signal(data, str(tmp_path))
+    tstamp = '1958-12-01'
+    signal.validation_split(tstamp)
+    signal.apply_model(ExponentialSmoothing())
+    with pytest.warns(UserWarning, match='NaN'):
+        signal.compute_scores()
+    assert not signal.models['ExponentialSmoothing']['scores']['unit_wise'].isnull().any(axis=None)
+
+
 def test_scores_time(get_univariate_data):
     signal = Signal(get_univariate_data, 'tests')
     tstamp = '1958-12-01'
@@ -141,6 +252,9 @@ def test_adfuller(get_univariate_data, get_multivariate_data):
     assert 'stationary: adfuller' in signal.tests_stat.keys()
     assert not signal.tests_stat['stationary: adfuller'][0]
     assert signal.tests_stat['stationary: adfuller'][1] > 0.95
+    result = signal.tests_stat['stationary: adfuller']
+    signal.apply_stat_test('stationary', 'adfuller')
+    assert signal.tests_stat['stationary: adfuller'] is result
     signal_m = Signal(get_multivariate_data, 'tests')
     with pytest.raises(TypeError):
         signal_m.apply_stat_test('stationary')
@@ -189,7 +303,23 @@ def test_operations(get_univariate_data):
     signal.validation_split(tstamp)
     with pytest.raises(Exception):
         signal.apply_operations(['outliers'])
+    assert not signal.has_transformations
     signal.apply_operations(['trend', 'seasonality'])
+    assert signal.has_transformations
     assert signal.rest_data.shape == signal.data.shape
     assert signal.rest_train_data.shape == signal.train_data.shape
 
+
+def test_conf_intervals(get_univariate_data):
+    signal = Signal(get_univariate_data, 'tests')
+    tstamp = '1958-12-01'
+    signal.validation_split(tstamp)
+    signal.apply_model(ExponentialSmoothing())
+    signal.forecast('ExponentialSmoothing', 12)
+    signal.compute_conf_intervals(window_size=3)
+    bounds = signal.models['ExponentialSmoothing']['test_confidence_interval']['passengers']
+    assert list(bounds.columns) == ['lower', 'upper']
+    assert bounds.shape == (24, 2)
+    assert (bounds['lower'].dropna() <= bounds['upper'].dropna()).all()
+    bounds = signal.models['ExponentialSmoothing']['forecast_confidence_interval']['passengers']
+    assert bounds.shape == (12, 2)
@@ -33,7 +33,13 @@ def test_show_predictions(get_univariate_data):
     tstamp = '1958-12-01'
     signal.validation_split(tstamp)
     signal.apply_model(ExponentialSmoothing())
-    Visualization(signal).show_predictions(display=False)
+    visualization = Visualization(signal)
+    visualization.show_predictions(display=False)
+    fig = visualization.figures['show_predictions']
+    visualization.show_predictions(display=False)
+    assert visualization.figures['show_predictions'] is fig
+    assert len(fig.axes) == 1
+    assert len(fig.axes[0].get_lines()) == 2
 
 
 def test_show_forecast(get_univariate_data):
@@ -43,3 +49,6 @@ def test_show_forecast(get_univariate_data):
     signal.apply_aggregated_model([AutoARIMA(), ExponentialSmoothing()])
     signal.forecast('AggregatedModel', 12)
     Visualization(signal).show_forecast(display=False)
+    signal.compute_conf_intervals(window_size=3)
+    Visualization(signal).show_predictions(aggregated_only=True, display=False)
+    Visualization(signal).show_forecast(aggregated_only=True, display=False)